@@ -48,18 +48,28 @@ class BleBridgeManager:
         self._adv_matched = 0
         self._adv_ignored = 0
 
+    def _write_locked_devices_sync(self) -> bool:
+        """Persist the current locks, preserving other settings.
+
+        Returns False without rewriting the file when it already holds them.
+        """
+        data = {}
+        if os.path.exists(CONFIG_PATH):
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        if data.get("locked_devices", {}) == self._locked_devices:
+            return False
+        data["locked_devices"] = self._locked_devices
+        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        return True
+
     def _save_locked_device_sync(self, device_type: str, address: str):
         """Save a locked device address to config file (preserving other settings)."""
         self._locked_devices[device_type] = address
         try:
-            data = {}
-            if os.path.exists(CONFIG_PATH):
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            data["locked_devices"] = self._locked_devices
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-            _LOGGER.info("Locked %s device address: %s", device_type, address)
+            if self._write_locked_devices_sync():
+                _LOGGER.info("Locked %s device address: %s", device_type, address)
         except Exception as exc:
             _LOGGER.warning("Failed to save locked device: %s", exc)
 
@@ -67,14 +77,8 @@ class BleBridgeManager:
         """Remove only the persisted BLE device locks, preserving all other settings."""
         self._locked_devices = {}
         try:
-            data = {}
-            if os.path.exists(CONFIG_PATH):
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            data["locked_devices"] = {}
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-            _LOGGER.info("Cleared persisted BLE device locks")
+            if self._write_locked_devices_sync():
+                _LOGGER.info("Cleared persisted BLE device locks")
         except Exception as exc:
             _LOGGER.warning("Failed to clear locked devices: %s", exc)
 
@@ -233,6 +237,12 @@ class BleBridgeManager:
             self._active_devices[address]["ble_device"] = service_info.device
             return
 
+        # Adverts without a local name can never match a handler. Home
+        # Assistant reports those with the device address as the name.
+        if not name or name == service_info.address:
+            self._adv_ignored += 1
+            return
+
         for handler_class in DEVICE_HANDLERS:
             if not handler_class.match_name(name):
                 continue
@@ -394,26 +404,17 @@ class BleBridgeManager:
                     return await handler.poll(client)
 
                 parsed = await self._execute_with_lock(address, _do_poll)
-                if not parsed:
-                    raise Exception("No status response")
-
-                await self._publish_messages(handler, parsed)
-
-                # Lock this address on first successful poll and retire stale peers.
-                if device_type not in self._locked_devices:
-                    await self.hass.async_add_executor_job(
-                        self._save_locked_device_sync, device_type, address
+                if parsed:
+                    await self._publish_messages(handler, parsed)
+                    if device_type not in self._locked_devices:
+                        await self._lock_device(device_type, address)
+                    await self._on_poll_success(device_type, address)
+                else:
+                    # An empty poll (e.g. a stale push stream) is an expected
+                    # connectivity outcome; report it without raising.
+                    await self._on_poll_failure(
+                        device_type, address, "No status response", ERROR_CONNECTIVITY,
                     )
-                    # Tear down any competing devices discovered during the unlocked
-                    # window so only the winner keeps polling.
-                    for other_addr in list(self._active_devices):
-                        entry_other = self._active_devices[other_addr]
-                        if other_addr != address and entry_other["handler"].device_type() == device_type:
-                            await self._teardown_device(other_addr)
-                    # Clear any retained MQTT topics left by those losing addresses.
-                    await self._retire_stale_addresses(device_type, address)
-
-                await self._on_poll_success(device_type, address)
 
             except AuthenticationError as exc:
                 await self._on_poll_failure(
@@ -433,18 +434,37 @@ class BleBridgeManager:
                 pass
             entry["wake"].clear()
 
+    async def _lock_device(self, device_type: str, address: str):
+        """Lock this address on first successful poll and retire stale peers."""
+        await self.hass.async_add_executor_job(
+            self._save_locked_device_sync, device_type, address
+        )
+        # Tear down any competing devices discovered during the unlocked
+        # window so only the winner keeps polling.
+        for other_addr in list(self._active_devices):
+            entry_other = self._active_devices[other_addr]
+            if other_addr != address and entry_other["handler"].device_type() == device_type:
+                await self._teardown_device(other_addr)
+        # Clear any retained MQTT topics left by those losing addresses.
+        await self._retire_stale_addresses(device_type, address)
+
     async def _on_poll_success(self, device_type: str, address: str):
         """Reset failure state and publish online on transition."""
         entry = self._active_devices.get(address)
         if not entry:
             return
+        had_failures = entry["failure_count"] != 0
         entry["failure_count"] = 0
+        going_online = entry["availability"] != PAYLOAD_ONLINE
         now = datetime.now(timezone.utc).isoformat()
 
         await self._publish(TOPIC_LAST_SUCCESS, device_type, address, now, retain=True)
-        await self._publish(TOPIC_FAILURE_COUNT, device_type, address, "0", retain=True)
+        # The retained count is already "0" in steady state; only reset it
+        # after failures or when (re)announcing the device.
+        if had_failures or going_online:
+            await self._publish(TOPIC_FAILURE_COUNT, device_type, address, "0", retain=True)
 
-        if entry["availability"] != PAYLOAD_ONLINE:
+        if going_online:
             entry["availability"] = PAYLOAD_ONLINE
             entry["last_error"] = ERROR_NONE
             await self._publish(TOPIC_AVAILABLE, device_type, address, PAYLOAD_ONLINE, retain=True)
@@ -479,16 +499,29 @@ class BleBridgeManager:
 
     # --- MQTT Command Handlers ---
 
-    async def _on_mqtt_command(self, msg):
-        """Handle inbound device commands on librecoach/ble/+/+/set."""
-        parts = msg.topic.split("/")
+    def _resolve_device_topic(self, topic: str):
+        """Split librecoach/ble/{type}/{address}/... once for the command handlers.
+
+        Returns None for a malformed topic, otherwise (device_type, address, entry)
+        where entry is None unless this bridge manages that address as that type.
+        """
+        parts = topic.split("/", 4)
         if len(parts) < 5:
-            return
+            return None
         device_type = parts[2]
         address = parts[3].lower()
-
         entry = self._active_devices.get(address)
-        if not entry or entry["handler"].device_type() != device_type:
+        if entry and entry["handler"].device_type() != device_type:
+            entry = None
+        return device_type, address, entry
+
+    async def _on_mqtt_command(self, msg):
+        """Handle inbound device commands on librecoach/ble/+/+/set."""
+        target = self._resolve_device_topic(msg.topic)
+        if target is None:
+            return
+        device_type, address, entry = target
+        if entry is None:
             _LOGGER.warning("Command for unknown device: %s/%s", device_type, address)
             return
 
@@ -515,29 +548,26 @@ class BleBridgeManager:
 
     async def _on_reconnect(self, msg):
         """Schedule an immediate retry for a device (F-6)."""
-        parts = msg.topic.split("/")
-        if len(parts) < 5:
+        target = self._resolve_device_topic(msg.topic)
+        if target is None:
             return
-        device_type = parts[2]
-        address = parts[3].lower()
-        entry = self._active_devices.get(address)
-        if not entry or entry["handler"].device_type() != device_type:
+        device_type, address, entry = target
+        if entry is None:
             _LOGGER.warning("Reconnect for unknown device: %s/%s", device_type, address)
             return
         _LOGGER.info("Manual reconnect requested for %s", address)
         entry["failure_count"] = 0          # retry at normal cadence
+        await self._publish(TOPIC_FAILURE_COUNT, device_type, address, "0", retain=True)
         await self._disconnect(address, entry)
         entry["wake"].set()                 # break the backoff sleep now
 
     async def _on_clear_errors(self, msg):
         """Clear failure/availability state for a device (F-6)."""
-        parts = msg.topic.split("/")
-        if len(parts) < 5:
+        target = self._resolve_device_topic(msg.topic)
+        if target is None:
             return
-        device_type = parts[2]
-        address = parts[3].lower()
-        entry = self._active_devices.get(address)
-        if not entry or entry["handler"].device_type() != device_type:
+        device_type, address, entry = target
+        if entry is None:
             return
         _LOGGER.info("Clearing error state for %s", address)
         entry["failure_count"] = 0
@@ -1,6 +1,26 @@
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant always ships orjson
+    orjson = None
+
+# Compact separators and raw UTF-8 match orjson's output for state payloads.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_payload(obj) -> str:
+    """Serialize a state payload to compact JSON text for an MQTT publish.
+
+    Uses orjson when available (it is a Home Assistant core dependency). The
+    standard-library fallback is configured to produce the same text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return _JSON_ENCODER.encode(obj)
+
 
 class AuthenticationError(Exception):
     """Raised when a device rejects credentials (distinct from BLE/connectivity errors).
@@ -11,7 +31,7 @@ class AuthenticationError(Exception):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class StateMessage:
     """A single MQTT publish produced by a device handler.
 
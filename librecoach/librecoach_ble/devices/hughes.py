@@ -1,13 +1,12 @@
 """Hughes Power Watchdog BLE protocol handler."""
 
 import asyncio
-import json
 import logging
 import struct
 import time
 
 from ..const import TOPIC_STATE
-from .base import BleDeviceHandler, StateMessage
+from .base import BleDeviceHandler, StateMessage, dumps_payload
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +14,7 @@ V1_PREFIXES = ("PMD", "PWS", "PMS")
 V2_PREFIXES = tuple(
     f"WD_{kind}{model}" for kind in ("V", "E") for model in range(5, 10)
 )
+NAME_PREFIXES = V1_PREFIXES + V2_PREFIXES
 BOOSTER_MODELS = ("V8", "E8", "V9", "E9")
 
 V1_TX_UUID = "0000ffe2-0000-1000-8000-00805f9b34fb"
@@ -31,6 +31,30 @@ V2_RELAY_OFF = 0x02
 V2_NEUTRAL_ENABLE = 0x00
 V2_NEUTRAL_DISABLE = 0x01
 
+# Command action -> (command id, payload for a true value, payload for false)
+_RELAY = (V2_SET_OPEN, bytes([V2_RELAY_ON]), bytes([V2_RELAY_OFF]))
+_NEUTRAL = (
+    V2_NEUTRAL_DETECTION, bytes([V2_NEUTRAL_ENABLE]), bytes([V2_NEUTRAL_DISABLE]),
+)
+_ENERGY_RESET = (V2_ENERGY_RESET, b"", b"")
+V2_ACTIONS = {
+    "relay": _RELAY,
+    "neutral": _NEUTRAL,
+    "neutral_detection": _NEUTRAL,
+    "reset": _ENERGY_RESET,
+    "reset_energy": _ENERGY_RESET,
+    "energy_reset": _ENERGY_RESET,
+}
+
+# Precompiled big-endian layouts for frame parsing
+V1_LINE_FORMAT = struct.Struct(">4i")  # voltage, current, power, energy
+V1_FREQUENCY_FORMAT = struct.Struct(">i")
+V2_LENGTH_FORMAT = struct.Struct(">H")
+# Per-line block: voltage, current, power, energy, 12 unused bytes, frequency
+V2_LINE_FORMAT = struct.Struct(">4I12xI")
+# Command header: magic, direction, sequence, command id, payload length
+V2_COMMAND_HEADER_FORMAT = struct.Struct(">4s3BH")
+
 NOTIFICATION_TIMEOUT = 60
 INITIAL_DATA_TIMEOUT = 5
 
@@ -55,6 +79,9 @@ class HughesHandler(BleDeviceHandler):
 
     def __init__(self, address, config):
         self.address = address.lower()
+        self._state_topic = TOPIC_STATE.format(
+            device_type=self.device_type(), address=self.address,
+        )
         self.device_name = config.get("_device_name", "")
         self.protocol = "V1" if self.device_name.startswith(V1_PREFIXES) else "V2"
         self.has_booster = any(model in self.device_name for model in BOOSTER_MODELS)
@@ -74,7 +101,7 @@ class HughesHandler(BleDeviceHandler):
 
     @staticmethod
     def match_name(name: str) -> bool:
-        return name.startswith(V1_PREFIXES + V2_PREFIXES)
+        return name.startswith(NAME_PREFIXES)
 
     async def authenticate(self, client) -> bool:
         """Subscribe to the device's push stream and wait for initial telemetry."""
@@ -101,20 +128,10 @@ class HughesHandler(BleDeviceHandler):
             return False
 
         action = command.get("command") or command.get("action")
-        value = command.get("value")
-        if action == "relay":
-            payload = bytes([V2_RELAY_ON if self._as_bool(value) else V2_RELAY_OFF])
-            command_id = V2_SET_OPEN
-        elif action in ("neutral", "neutral_detection"):
-            payload = bytes([
-                V2_NEUTRAL_ENABLE if self._as_bool(value) else V2_NEUTRAL_DISABLE
-            ])
-            command_id = V2_NEUTRAL_DETECTION
-        elif action in ("reset", "reset_energy", "energy_reset"):
-            payload = b""
-            command_id = V2_ENERGY_RESET
-        else:
+        if not isinstance(action, str) or action not in V2_ACTIONS:
             return False
+        command_id, true_payload, false_payload = V2_ACTIONS[action]
+        payload = true_payload if self._as_bool(command.get("value")) else false_payload
 
         packet = self.build_v2_command(command_id, payload)
         loop = asyncio.get_running_loop()
@@ -134,8 +151,7 @@ class HughesHandler(BleDeviceHandler):
         return self._parse_v2(raw)
 
     def state_messages(self, parsed: dict) -> list[StateMessage]:
-        topic = TOPIC_STATE.format(device_type=self.device_type(), address=self.address)
-        return [StateMessage(topic, json.dumps(parsed), retain=False)]
+        return [StateMessage(self._state_topic, dumps_payload(parsed), retain=False)]
 
     @staticmethod
     def _as_bool(value) -> bool:
@@ -145,28 +161,25 @@ class HughesHandler(BleDeviceHandler):
 
     def build_v2_command(self, command: int, payload: bytes = b"") -> bytes:
         self._sequence = (self._sequence % 100) + 1
-        return (
-            V2_HEADER
-            + bytes([0x01, self._sequence, command])
-            + struct.pack(">H", len(payload))
-            + payload
-            + V2_END
+        header = V2_COMMAND_HEADER_FORMAT.pack(
+            V2_HEADER, 0x01, self._sequence, command, len(payload)
         )
+        return header + payload + V2_END
 
     def _on_v1_notification(self, sender, data):
-        chunk = bytes(data)
-        if chunk.startswith(b"\x01\x03\x20"):
+        # bleak hands over a bytearray; extend straight from it without a copy
+        if data.startswith(b"\x01\x03\x20"):
             self._buffer.clear()
-        self._buffer.extend(chunk)
+        self._buffer.extend(data)
         while len(self._buffer) >= 40:
-            frame = bytes(self._buffer[:40])
+            frame = self._buffer[:40]  # one bytearray copy; parsers accept it
             del self._buffer[:40]
             parsed = self._parse_v1(frame)
             if parsed:
                 self._cache_state(parsed)
 
     def _on_v2_notification(self, sender, data):
-        self._buffer.extend(bytes(data))
+        self._buffer.extend(data)
         while True:
             start = self._buffer.find(V2_HEADER)
             if start < 0:
@@ -176,11 +189,11 @@ class HughesHandler(BleDeviceHandler):
                 del self._buffer[:start]
             if len(self._buffer) < 9:
                 return
-            payload_length = struct.unpack(">H", self._buffer[7:9])[0]
+            payload_length = V2_LENGTH_FORMAT.unpack_from(self._buffer, 7)[0]
             frame_length = 9 + payload_length + 2
             if len(self._buffer) < frame_length:
                 return
-            frame = bytes(self._buffer[:frame_length])
+            frame = self._buffer[:frame_length]
             del self._buffer[:frame_length]
             if frame[-2:] != V2_END:
                 continue
@@ -210,10 +223,9 @@ class HughesHandler(BleDeviceHandler):
         if len(raw) != 40 or raw[:3] != b"\x01\x03\x20":
             return {}
         voltage, current, power, energy = (
-            struct.unpack(">i", raw[start:start + 4])[0] / 10000
-            for start in (3, 7, 11, 15)
+            value / 10000 for value in V1_LINE_FORMAT.unpack_from(raw, 3)
         )
-        frequency = struct.unpack(">i", raw[31:35])[0] / 100
+        frequency = V1_FREQUENCY_FORMAT.unpack_from(raw, 31)[0] / 100
         line = {
             "voltage": voltage,
             "current": current,
@@ -233,7 +245,7 @@ class HughesHandler(BleDeviceHandler):
     def _parse_v2(self, raw: bytes) -> dict:
         if len(raw) < 27 or raw[:4] != V2_HEADER or raw[-2:] != V2_END:
             return {}
-        payload_length = struct.unpack(">H", raw[7:9])[0]
+        payload_length = V2_LENGTH_FORMAT.unpack_from(raw, 7)[0]
         if payload_length not in (34, 68) or len(raw) != payload_length + 11:
             return {}
         self._line_1 = self._parse_v2_line(raw, 9)
@@ -258,12 +270,13 @@ class HughesHandler(BleDeviceHandler):
 
     @staticmethod
     def _parse_v2_line(raw: bytes, offset: int) -> dict:
+        voltage, current, power, energy, frequency = V2_LINE_FORMAT.unpack_from(raw, offset)
         return {
-            "voltage": struct.unpack(">I", raw[offset:offset + 4])[0] / 10000,
-            "current": struct.unpack(">I", raw[offset + 4:offset + 8])[0] / 10000,
-            "power": struct.unpack(">I", raw[offset + 8:offset + 12])[0] / 10000,
-            "energy": struct.unpack(">I", raw[offset + 12:offset + 16])[0] / 10000,
-            "frequency": struct.unpack(">I", raw[offset + 28:offset + 32])[0] / 100,
+            "voltage": voltage / 10000,
+            "current": current / 10000,
+            "power": power / 10000,
+            "energy": energy / 10000,
+            "frequency": frequency / 100,
         }
 
     def _build_state(self, protocol: str, error_code: int) -> dict:
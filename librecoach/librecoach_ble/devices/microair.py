@@ -5,7 +5,7 @@ import logging
 from bleak import BleakError
 
 from ..const import TOPIC_STATE
-from .base import BleDeviceHandler, StateMessage, AuthenticationError
+from .base import BleDeviceHandler, StateMessage, AuthenticationError, dumps_payload
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,8 +44,21 @@ FAN_MODE_MAP = {
     128: "auto",
 }
 
+# Zone status field holding the fan setting for each operating mode. Heat is
+# resolved separately because gas heat uses the furnace fan setting.
+FAN_MODE_KEY_BY_MODE = {
+    "cool": "cool_fan_mode_num",
+    "auto": "auto_fan_mode_num",
+    "dry": "dry_fan_mode_num",
+    "fan_only": "fan_mode_num",
+}
+
 UNAVAILABLE_TEMPERATURE = -32768
 
+# Get Status goes out on every poll, auth check and command read-back, so its
+# wire bytes are encoded once rather than per request.
+GET_STATUS_BYTES = json.dumps({"Type": "Get Status"}).encode("utf-8")
+
 FAULT_DESCRIPTIONS = {
     0: "No fault",
     1: "No communication",
@@ -71,10 +84,16 @@ class MicroAirHandler(BleDeviceHandler):
 
     def __init__(self, address, config):
         self.address = address
-        self._password = (config.get("microair_password") or "").strip()
+        self._state_topic = TOPIC_STATE.format(
+            device_type=self.device_type(), address=address,
+        )
+        # Encoded once; it is written on every (re)authentication.
+        self._password_bytes = (config.get("microair_password") or "").strip().encode("utf-8")
         self._email = (config.get("microair_email") or "").strip()
         self._zone_configs = {}
         self._config_attempts = {}
+        # Retained zone config messages, rebuilt only when a zone's config changes
+        self._zone_config_messages = {}
 
     @staticmethod
     def device_type() -> str:
@@ -86,13 +105,20 @@ class MicroAirHandler(BleDeviceHandler):
 
     async def _request_json(self, client, command: dict) -> dict | None:
         """Helper to write JSON to jsonCmd and read from jsonReturn with delay."""
-        cmd_bytes = json.dumps(command).encode("utf-8")
+        return await self._request_raw(client, json.dumps(command).encode("utf-8"))
+
+    async def _get_status(self, client) -> dict | None:
+        """Send the pre-encoded Get Status request."""
+        return await self._request_raw(client, GET_STATUS_BYTES)
+
+    async def _request_raw(self, client, cmd_bytes: bytes) -> dict | None:
+        """Write encoded JSON to jsonCmd and parse the jsonReturn reply."""
         await client.write_gatt_char(UUIDS["jsonCmd"], cmd_bytes, response=True)
         await asyncio.sleep(1.0)
         result = await client.read_gatt_char(UUIDS["jsonReturn"])
         if not result:
             return None
-        return json.loads(bytes(result).decode("utf-8"))
+        return json.loads(result)  # json accepts UTF-8 bytes directly
 
     async def authenticate(self, client) -> bool:
         """Authenticate, then confirm access with a cheap read (B-5).
@@ -101,15 +127,15 @@ class MicroAirHandler(BleDeviceHandler):
         password was rejected -> AuthenticationError. No response at all is a
         connectivity problem -> BleakError, which the bridge retries/backs off.
         """
-        if self._password:
+        if self._password_bytes:
             await client.write_gatt_char(
                 UUIDS["passwordCmd"],
-                self._password.encode("utf-8"),
+                self._password_bytes,
                 response=True,
             )
             await asyncio.sleep(1.0)
 
-        raw = await self._request_json(client, {"Type": "Get Status"})
+        raw = await self._get_status(client)
         if raw is None:
             raise BleakError("No response during authentication")
         if not isinstance(raw, dict) or "Z_sts" not in raw:
@@ -118,7 +144,7 @@ class MicroAirHandler(BleDeviceHandler):
 
     async def poll(self, client) -> dict | None:
         """Send Get Status, read and parse response."""
-        raw = await self._request_json(client, {"Type": "Get Status"})
+        raw = await self._get_status(client)
         if not raw:
             return None
 
@@ -197,6 +223,7 @@ class MicroAirHandler(BleDeviceHandler):
                 "SPL": cfg.get("SPL", [60, 85, 50, 85]),
                 "MA": cfg.get("MA", [0] * 16),
             }
+            self._zone_config_messages.pop(zone, None)
             _LOGGER.info("Get Config: cached zone %s capabilities (MAV=%s)", zone, mav)
             stored = True
         if not stored:
@@ -205,6 +232,8 @@ class MicroAirHandler(BleDeviceHandler):
 
     async def handle_command(self, client, command: dict) -> dict | bool:
         """Write a command dict to the device and read back verified status."""
+        if not isinstance(command, dict):
+            return False
         cmd_bytes = json.dumps(command).encode("utf-8")
         await client.write_gatt_char(UUIDS["jsonCmd"], cmd_bytes, response=True)
 
@@ -212,7 +241,7 @@ class MicroAirHandler(BleDeviceHandler):
         if command.get("Type") == "Change":
             try:
                 await asyncio.sleep(0.3)
-                raw = await self._request_json(client, {"Type": "Get Status"})
+                raw = await self._get_status(client)
                 if raw:
                     return self.parse_status(raw)
             except Exception as exc:
@@ -330,7 +359,7 @@ class MicroAirHandler(BleDeviceHandler):
         """
         device_type = self.device_type()
         address = self.address
-        state_topic = TOPIC_STATE.format(device_type=device_type, address=address)
+        state_topic = self._state_topic
         zones = parsed.get("zones", {}) or {}
         zone_configs = parsed.get("zone_configs", {}) or {}
 
@@ -340,7 +369,7 @@ class MicroAirHandler(BleDeviceHandler):
                 continue
             payload = dict(zone_state)
             payload["zone"] = zone_num
-            messages.append(StateMessage(state_topic, json.dumps(payload), retain=False))
+            messages.append(StateMessage(state_topic, dumps_payload(payload), retain=False))
 
             # Non-numeric zone keys must not crash publishing.
             try:
@@ -348,24 +377,23 @@ class MicroAirHandler(BleDeviceHandler):
             except (ValueError, TypeError):
                 continue
             if int_zone in zone_configs:
-                cfg_topic = f"librecoach/ble/{device_type}/{address}/zone/{zone_num}/config"
-                messages.append(
-                    StateMessage(cfg_topic, json.dumps(zone_configs[int_zone]), retain=True)
-                )
+                cfg_message = self._zone_config_messages.get(int_zone)
+                if cfg_message is None:
+                    cfg_topic = f"librecoach/ble/{device_type}/{address}/zone/{zone_num}/config"
+                    cfg_message = StateMessage(
+                        cfg_topic, dumps_payload(zone_configs[int_zone]), retain=True
+                    )
+                    self._zone_config_messages[int_zone] = cfg_message
+                messages.append(cfg_message)
         return messages
 
     def _select_fan_mode(self, zone_status):
         mode = zone_status.get("mode")
-        if mode == "cool":
-            return zone_status.get("cool_fan_mode_num", 0)
         if mode == "heat":
             if zone_status.get("mode_num") in GAS_HEAT_MODES:
                 return zone_status.get("furnace_fan_mode_num", 0)
             return zone_status.get("heat_fan_mode_num", 0)
-        if mode == "auto":
-            return zone_status.get("auto_fan_mode_num", 0)
-        if mode == "dry":
-            return zone_status.get("dry_fan_mode_num", 0)
-        if mode == "fan_only":
-            return zone_status.get("fan_mode_num", 0)
-        return 0
+        key = FAN_MODE_KEY_BY_MODE.get(mode)
+        if key is None:
+            return 0
+        return zone_status.get(key, 0)
@@ -4,10 +4,12 @@ These run against fakes for Home Assistant and bleak (see conftest.py).
 """
 import asyncio
 import json
+from types import SimpleNamespace
 
 import conftest  # registers fakes; exposes recorders
 
 from librecoach_ble.bridge import BleBridgeManager
+from librecoach_ble.devices import base
 from librecoach_ble.devices.base import BleDeviceHandler, StateMessage, AuthenticationError
 from librecoach_ble.devices.microair import MicroAirHandler
 from librecoach_ble import const
@@ -61,6 +63,26 @@ def test_b1_single_callback_two_handlers(monkeypatch):
     assert len(conftest.REGISTERED_CALLBACKS) == 1
 
 
+def test_b1_unnamed_advertisement_is_ignored(monkeypatch):
+    class NeverAsked(MicroAirHandler):
+        @staticmethod
+        def match_name(name):  # pragma: no cover - must not be reached
+            raise AssertionError("unnamed adverts should not reach handlers")
+
+    import librecoach_ble.bridge as bridge_mod
+    monkeypatch.setattr(bridge_mod, "DEVICE_HANDLERS", [NeverAsked])
+
+    mgr = BleBridgeManager(FakeHass(), {}, {"microair"})
+    # Home Assistant fills in the address when an advert carries no local name.
+    info = SimpleNamespace(
+        name="AA:BB:CC:DD:EE:FF", address="AA:BB:CC:DD:EE:FF", device=object(),
+    )
+    mgr._on_ble_advertisement(info, "advertisement")
+
+    assert mgr._active_devices == {}
+    assert mgr._adv_ignored == 1
+
+
 # --- B-2: handler owns topic construction; bridge stays generic ---
 
 def test_b2_microair_topics_unchanged():
@@ -89,6 +111,12 @@ def test_b2_nonnumeric_zone_keys_do_not_crash():
     assert any(m.topic.endswith("/state") for m in msgs)
 
 
+def test_payload_fallback_matches_compact_utf8_output(monkeypatch):
+    payload = {"zone": 0, "name": "Salón", "sp": [60, 85], "fault": None}
+    monkeypatch.setattr(base, "orjson", None)
+    assert base.dumps_payload(payload) == '{"zone":0,"name":"Salón","sp":[60,85],"fault":null}'
+
+
 def test_microair_poll_uses_per_zone_config_request(monkeypatch):
     handler = MicroAirHandler("aa:bb", {})
     requests = []
@@ -101,14 +129,14 @@ def test_microair_poll_uses_per_zone_config_request(monkeypatch):
         },
     ])
 
-    async def fake_request(client, command):
-        requests.append(command)
+    async def fake_request(client, cmd_bytes):
+        requests.append(json.loads(cmd_bytes))
         return next(responses)
 
     async def no_sleep(_delay):
         return None
 
-    monkeypatch.setattr(handler, "_request_json", fake_request)
+    monkeypatch.setattr(handler, "_request_raw", fake_request)
     monkeypatch.setattr("librecoach_ble.devices.microair.asyncio.sleep", no_sleep)
 
     parsed = run(handler.poll(object()))
@@ -117,6 +145,19 @@ def test_microair_poll_uses_per_zone_config_request(monkeypatch):
     assert parsed["zone_configs"][0]["MAV"] == 6
 
 
+def test_microair_rejects_non_object_command_without_writing():
+    handler = MicroAirHandler("aa:bb", {})
+    writes = []
+
+    class Client:
+        async def write_gatt_char(self, uuid, data, response=True):
+            writes.append(data)
+
+    for command in (None, 5, "Change", ["Type", "Change"]):
+        assert run(handler.handle_command(Client(), command)) is False
+    assert writes == []
+
+
 def test_microair_does_not_cache_config_without_capabilities():
     handler = MicroAirHandler("aa:bb", {})
 
@@ -137,6 +178,26 @@ def test_microair_parses_string_encoded_capabilities():
     assert handler._zone_configs[1]["MAV"] == 3126
 
 
+def test_microair_zone_config_message_refreshes_after_new_config():
+    handler = MicroAirHandler("aa:bb", {})
+
+    def config_payload():
+        parsed = {"zones": {0: {"mode": "cool"}}, "zone_configs": handler._zone_configs}
+        msgs = handler.state_messages(parsed)
+        return [json.loads(m.payload) for m in msgs if m.topic.endswith("/zone/0/config")]
+
+    handler._store_capability_config({
+        "Type": "Response", "RT": "Config", "CFG": {"Zone": 0, "MAV": 6},
+    })
+    assert [cfg["MAV"] for cfg in config_payload()] == [6]
+    assert [cfg["MAV"] for cfg in config_payload()] == [6]
+
+    handler._store_capability_config({
+        "Type": "Response", "RT": "Config", "CFG": {"Zone": 0, "MAV": 14},
+    })
+    assert [cfg["MAV"] for cfg in config_payload()] == [14]
+
+
 def test_microair_omits_unavailable_outdoor_temperature():
     handler = MicroAirHandler("aa:bb", {})
 
@@ -285,6 +346,37 @@ def test_retire_ignores_already_cleared_retained(monkeypatch):
     assert conftest.PUBLISHED == []
 
 
+# --- B-3: lock persistence preserves other settings and skips no-op rewrites ---
+
+def test_b3_lock_file_rewritten_only_when_locks_change(monkeypatch, tmp_path):
+    path = tmp_path / "ble-config.json"
+    path.write_text(json.dumps({"microair_password": "pw", "locked_devices": {}}))
+    monkeypatch.setattr("librecoach_ble.bridge.CONFIG_PATH", str(path))
+    mgr = BleBridgeManager(FakeHass(), {})
+    rewrites = []
+    write = mgr._write_locked_devices_sync
+
+    def recording_write():
+        rewritten = write()
+        rewrites.append(rewritten)
+        return rewritten
+
+    mgr._write_locked_devices_sync = recording_write
+
+    mgr._clear_locked_devices_sync()
+    assert rewrites == [False]
+
+    mgr._save_locked_device_sync("microair", "aa:bb")
+    mgr._save_locked_device_sync("microair", "aa:bb")
+    assert rewrites == [False, True, False]
+    saved = json.loads(path.read_text())
+    assert saved == {"microair_password": "pw", "locked_devices": {"microair": "aa:bb"}}
+
+    mgr._clear_locked_devices_sync()
+    assert rewrites == [False, True, False, True]
+    assert json.loads(path.read_text())["locked_devices"] == {}
+
+
 # --- B-4: backoff schedule ---
 
 def test_b4_backoff_progression():
@@ -345,3 +437,44 @@ def test_b4_recovery_publishes_online_on_transition():
               if p["topic"].endswith("/available") and p["payload"] == const.PAYLOAD_ONLINE]
     assert len(online) == 1
     assert mgr._active_devices[addr]["failure_count"] == 0
+
+
+def test_b4_steady_success_does_not_republish_failure_count():
+    conftest.reset_recorders()
+    mgr = BleBridgeManager(FakeHass(), {})
+    addr = "aa:bb"
+    mgr._active_devices[addr] = {
+        "failure_count": 0, "availability": const.PAYLOAD_ONLINE, "last_error": const.ERROR_NONE,
+    }
+    run(mgr._on_poll_success("microair", addr))
+    topics = [p["topic"] for p in conftest.PUBLISHED]
+    assert any(t.endswith("/last_success") for t in topics)
+    assert not any(t.endswith("/failure_count") for t in topics)
+
+    mgr._active_devices[addr]["failure_count"] = 2
+    run(mgr._on_poll_success("microair", addr))
+    counts = [p["payload"] for p in conftest.PUBLISHED if p["topic"].endswith("/failure_count")]
+    assert counts == ["0"]
+
+
+# --- F-6: per-device command topics resolve to the owning device only ---
+
+def test_clear_errors_ignores_topic_with_wrong_device_type():
+    conftest.reset_recorders()
+    mgr = BleBridgeManager(FakeHass(), {})
+    addr = "aa:bb"
+    mgr._active_devices[addr] = {
+        "handler": MicroAirHandler(addr, {}),
+        "failure_count": 4, "availability": const.PAYLOAD_OFFLINE,
+        "last_error": const.ERROR_CONNECTIVITY, "wake": asyncio.Event(),
+    }
+
+    wrong = SimpleNamespace(topic="librecoach/ble/hughes/AA:BB/clear_errors")
+    run(mgr._on_clear_errors(wrong))
+    assert mgr._active_devices[addr]["failure_count"] == 4
+    assert conftest.PUBLISHED == []
+
+    right = SimpleNamespace(topic="librecoach/ble/microair/AA:BB/clear_errors")
+    run(mgr._on_clear_errors(right))
+    assert mgr._active_devices[addr]["failure_count"] == 0
+    assert mgr._active_devices[addr]["wake"].is_set()
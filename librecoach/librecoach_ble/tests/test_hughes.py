@@ -77,6 +77,29 @@ def test_v1_two_line_frames_build_combined_state():
     assert second["supports_control"] is False
 
 
+def test_v1_notifications_reassemble_split_frames():
+    handler = HughesHandler("AA:BB", {"_device_name": "PMD123"})
+    frame = v1_frame(1, voltage=119.8)
+
+    handler._on_v1_notification(None, bytearray(frame[:20]))
+    assert handler._latest_state is None
+    handler._on_v1_notification(None, bytearray(frame[20:]))
+
+    assert handler._latest_state["voltage_l1"] == 119.8
+
+
+def test_v2_notifications_skip_noise_and_reassemble_split_frames():
+    handler = HughesHandler("AA:BB", {"_device_name": "WD_V5_123"})
+    frame = v2_frame(v2_block(121.4, 14.3, 1735.0, 142.3, relay=1))
+
+    handler._on_v2_notification(None, bytearray(b"\x00\x00" + frame[:20]))
+    assert handler._latest_state is None
+    handler._on_v2_notification(None, bytearray(frame[20:]))
+
+    assert handler._latest_state["voltage_l1"] == 121.4
+    assert handler._latest_state["relay_status"] == 1
+
+
 def test_v2_30a_frame_and_state_message():
     handler = HughesHandler("AA:BB", {"_device_name": "WD_V5_123"})
     state = handler.parse_status(v2_frame(v2_block(121.4, 14.3, 1735.0, 142.3)))
@@ -1,11 +1,13 @@
 import asyncio
 import logging
 import os
+import re
 import subprocess
 
 import can
 
 from can_routing import (
+    format_frame,
     format_timestamped_frame,
     timestamped_topic_for_can_id,
     topic_for_can_id,
@@ -18,6 +20,14 @@ CAN_BITRATE = "250000"
 TOPIC_SEND = "can/send"
 TOPIC_STATUS = "can/status"
 
+# Upper bound on frames drained from the socket per executor round-trip
+RECV_BATCH_MAX = 64
+# Upper bound on queued outbound frames sent per executor round-trip
+SEND_BATCH_MAX = 64
+
+# Legacy raw-hex send payload: 8-char extended ID followed by data
+RAW_HEX_PAYLOAD = re.compile(r"[0-9A-Fa-f]{9,}")
+
 
 class CanBridge:
     def __init__(self, config, mqtt):
@@ -81,15 +91,9 @@ class CanBridge:
             check=False, capture_output=True,
         )
 
-        # Set type and bitrate
+        # Set type and bitrate and bring up in a single netlink request
         subprocess.run(
-            ["ip", "link", "set", iface, "type", "can", "bitrate", CAN_BITRATE],
-            check=True, capture_output=True,
-        )
-
-        # Bring up
-        subprocess.run(
-            ["ip", "link", "set", iface, "up"],
+            ["ip", "link", "set", iface, "up", "type", "can", "bitrate", CAN_BITRATE],
             check=True, capture_output=True,
         )
 
@@ -128,28 +132,9 @@ class CanBridge:
         loop = asyncio.get_running_loop()
         while not self._stopping:
             try:
-                msg = await loop.run_in_executor(None, self._bus.recv, 1.0)
-                if msg is None:
-                    continue
-
-                if msg.is_extended_id:
-                    can_id = f"{msg.arbitration_id:08X}"
-                else:
-                    can_id = f"{msg.arbitration_id:03X}"
-                data_hex = msg.data.hex().upper()
-                frame = f"{can_id}#{data_hex}"
-                # V-6: high-rate raw CAN telemetry uses QoS 0 (fire-and-forget) to
-                # reduce broker overhead. Commands/status/config stay at QoS 1.
-                topic = topic_for_can_id(msg.arbitration_id)
-                self.mqtt.publish(topic, frame, qos=0, retain=False)
-                # A companion candump-compatible stream preserves SocketCAN's
-                # source timestamp. Existing consumers keep the bare topics.
-                self.mqtt.publish(
-                    timestamped_topic_for_can_id(msg.arbitration_id),
-                    format_timestamped_frame(msg, self.can_interface),
-                    qos=0,
-                    retain=False,
-                )
+                batch = await loop.run_in_executor(None, self._recv_batch)
+                for msg in batch:
+                    self._publish_frame(msg)
             except can.CanError as exc:
                 log.warning("CAN read error: %s, retrying...", exc)
                 await asyncio.sleep(1.0)
@@ -158,15 +143,69 @@ class CanBridge:
                     log.error("Unexpected CAN read error: %s", exc)
                     await asyncio.sleep(1.0)
 
+    def _recv_batch(self):
+        """Wait up to 1 s for a frame, then drain any already queued (runs in executor).
+
+        Busy RV-C buses deliver frames in bursts; taking them together costs one
+        executor round-trip per burst instead of one per frame.
+        """
+        msg = self._bus.recv(1.0)
+        if msg is None:
+            return []
+        batch = [msg]
+        while len(batch) < RECV_BATCH_MAX:
+            try:
+                msg = self._bus.recv(0)
+            except can.CanError:
+                break  # the next blocking recv surfaces it
+            if msg is None:
+                break
+            batch.append(msg)
+        return batch
+
+    def _publish_frame(self, msg):
+        frame = format_frame(msg)
+        # V-6: high-rate raw CAN telemetry uses QoS 0 (fire-and-forget) to
+        # reduce broker overhead. Commands/status/config stay at QoS 1.
+        topic = topic_for_can_id(msg.arbitration_id)
+        self.mqtt.publish(topic, frame, qos=0, retain=False)
+        # A companion candump-compatible stream preserves SocketCAN's
+        # source timestamp. Existing consumers keep the bare topics.
+        self.mqtt.publish(
+            timestamped_topic_for_can_id(msg.arbitration_id),
+            format_timestamped_frame(msg, self.can_interface, frame),
+            qos=0,
+            retain=False,
+        )
+
     async def _write_loop(self):
         loop = asyncio.get_running_loop()
         while not self._stopping:
-            payload = await self._send_queue.get()
-            if payload is None:
-                continue
+            payloads = [await self._send_queue.get()]
+            # Take whatever else is already queued so a burst of commands
+            # costs one executor round-trip.
+            while len(payloads) < SEND_BATCH_MAX:
+                try:
+                    payloads.append(self._send_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            msgs = []
+            for payload in payloads:
+                if payload is None:
+                    continue
+                try:
+                    msgs.append(self._parse_payload(payload))
+                except Exception as exc:
+                    log.warning("Failed to send CAN frame: %s", exc)
+            if msgs:
+                await loop.run_in_executor(None, self._send_batch, msgs)
+
+    def _send_batch(self, msgs):
+        """Send frames in queue order (runs in executor)."""
+        for msg in msgs:
             try:
-                msg = self._parse_payload(payload)
-                await loop.run_in_executor(None, self._bus.send, msg)
+                self._bus.send(msg)
             except Exception as exc:
                 log.warning("Failed to send CAN frame: %s", exc)
 
@@ -184,7 +223,7 @@ class CanBridge:
             can_id_str, data_str = text.split("#", 1)
             can_id_str = can_id_str.strip()
             data_str = data_str.strip()
-        elif len(text) > 8 and all(c in "0123456789ABCDEFabcdef" for c in text):
+        elif RAW_HEX_PAYLOAD.fullmatch(text):
             # Legacy raw hex: first 8 chars = extended CAN ID, rest = data
             can_id_str = text[:8]
             data_str = text[8:]
@@ -14,14 +14,21 @@ def timestamped_topic_for_can_id(_arbitration_id):
     return TOPIC_TIMESTAMPED
 
 
-def format_timestamped_frame(message, interface):
-    """Format python-can input as a candump -L compatible source record."""
+def format_frame(message):
+    """Format python-can input as a bare CANID#DATA record."""
     can_id = (
         f"{message.arbitration_id:08X}"
         if message.is_extended_id
         else f"{message.arbitration_id:03X}"
     )
-    return (
-        f"({message.timestamp:.6f}) {interface} "
-        f"{can_id}#{message.data.hex().upper()}"
-    )
+    return f"{can_id}#{message.data.hex().upper()}"
+
+
+def format_timestamped_frame(message, interface, frame=None):
+    """Format python-can input as a candump -L compatible source record.
+
+    Pass ``frame`` to reuse a record already built by format_frame().
+    """
+    if frame is None:
+        frame = format_frame(message)
+    return f"({message.timestamp:.6f}) {interface} {frame}"
@@ -1,4 +1,5 @@
 import asyncio
+import bisect
 import csv
 import json
 import logging
@@ -16,6 +17,7 @@ POLL_INTERVAL = 60  # seconds
 SUPERVISOR_URL = "http://supervisor/core/api"
 MQTT_TOPIC = "can/status/geo"
 EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = EARTH_RADIUS_MILES * math.pi / 180
 CSV_PATH = os.path.join(os.path.dirname(__file__), "us_cities.csv")
 
 
@@ -40,6 +42,7 @@ class GeoBridge:
         self._token = os.environ.get("SUPERVISOR_TOKEN", "")
 
         self._cities = []
+        self._city_lats = []
         self._last_lat = None
         self._last_lon = None
         self._poll_task = None
@@ -49,7 +52,7 @@ class GeoBridge:
         return bool(self.config.get("geo_enabled")) and bool(self._primary)
 
     async def start(self):
-        self._cities = await asyncio.get_running_loop().run_in_executor(
+        self._cities, self._city_lats = await asyncio.get_running_loop().run_in_executor(
             None, self._load_cities
         )
         log.info("Loaded %d US cities for geo lookup", len(self._cities))
@@ -183,17 +186,17 @@ class GeoBridge:
 
     async def _check_and_update(self, lat, lon, gps_elev, tracker_id, force=False):
         """Compare position to last known, update HA if threshold exceeded."""
-        if self._last_lat is not None and not force:
-            dist = _haversine(self._last_lat, self._last_lon, lat, lon)
-            if dist < self._threshold:
-                return
-
         distance_moved = 0.0
         if self._last_lat is not None:
             distance_moved = _haversine(self._last_lat, self._last_lon, lat, lon)
+            if not force and distance_moved < self._threshold:
+                return
 
-        # Find nearest city
-        city = self._find_nearest_city(lat, lon)
+        # Find nearest city (a scan of the bundled city table; kept off the
+        # event loop so CAN forwarding is not stalled)
+        city = await asyncio.get_running_loop().run_in_executor(
+            None, self._find_nearest_city, lat, lon
+        )
         if city is None:
             log.warning("No city match found for %.4f, %.4f", lat, lon)
             timezone = None
@@ -250,38 +253,65 @@ class GeoBridge:
     # ------------------------------------------------------------------
 
     def _load_cities(self):
-        """Load us_cities.csv into a list of dicts."""
+        """Load us_cities.csv as (cities, latitudes), both sorted by latitude.
+
+        The latitude list is the bisect key for _find_nearest_city, so it is
+        only ever built alongside the city list it indexes.
+        """
         cities = []
         if not os.path.exists(CSV_PATH):
             log.error("City data file not found: %s", CSV_PATH)
-            return cities
-        with open(CSV_PATH, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            return [], []
+        with open(CSV_PATH, "r", encoding="utf-8", newline="") as f:
+            # Plain rows indexed by header position; DictReader would build a
+            # throwaway dict for each of the ~17k rows.
+            reader = csv.reader(f)
+            header = next(reader, [])
+            try:
+                lat_i, lon_i, name_i, state_i, tz_i, elev_i = (
+                    header.index(column)
+                    for column in ("lat", "lon", "name", "state", "timezone", "elevation_m")
+                )
+            except ValueError as exc:
+                log.error("City data file has unexpected columns: %s", exc)
+                return [], []
             for row in reader:
                 try:
                     cities.append({
-                        "lat": float(row["lat"]),
-                        "lon": float(row["lon"]),
-                        "name": row["name"],
-                        "state": row["state"],
-                        "timezone": row["timezone"],
-                        "elevation_m": float(row["elevation_m"]),
+                        "lat": float(row[lat_i]),
+                        "lon": float(row[lon_i]),
+                        "name": row[name_i],
+                        "state": row[state_i],
+                        "timezone": row[tz_i],
+                        "elevation_m": float(row[elev_i]),
                     })
-                except (ValueError, KeyError) as exc:
+                except (ValueError, IndexError) as exc:
                     log.debug("Skipping malformed city row: %s", exc)
-        return cities
+        cities.sort(key=lambda city: city["lat"])
+        return cities, [city["lat"] for city in cities]
 
     def _find_nearest_city(self, lat, lon):
-        """Find the nearest city by Haversine distance. Returns dict or None."""
-        if not self._cities:
+        """Find the nearest city by Haversine distance. Returns dict or None.
+
+        A great-circle distance is never shorter than its north-south arc, so
+        the scan walks outward from the query latitude and stops in each
+        direction once the latitude gap alone exceeds the best match.
+        """
+        cities = self._cities
+        if not cities:
             return None
         best = None
         best_dist = float("inf")
-        for city in self._cities:
-            d = _haversine(lat, lon, city["lat"], city["lon"])
-            if d < best_dist:
-                best_dist = d
-                best = city
+        start = bisect.bisect_left(self._city_lats, lat)
+        for indices in (range(start, len(cities)), range(start - 1, -1, -1)):
+            for i in indices:
+                city = cities[i]
+                if abs(city["lat"] - lat) * MILES_PER_DEGREE_LAT > best_dist:
+                    break
+                d = _haversine(lat, lon, city["lat"], city["lon"])
+                if d < best_dist:
+                    best_dist = d
+                    best = city
         return best
 
     # ------------------------------------------------------------------
@@ -6,6 +6,9 @@ import paho.mqtt.client as mqtt
 
 log = logging.getLogger("vehicle_bridge.mqtt")
 
+# Upper bound on how long disconnect() waits for the last publish to go out
+PUBLISH_DRAIN_TIMEOUT = 0.5
+
 
 class MqttClient:
     def __init__(self, config):
@@ -16,6 +19,7 @@ class MqttClient:
         self._subscriptions = {}
         self._loop = None
         self._connected = False
+        self._last_publish = None
 
         user = config.get("mqtt_user")
         password = config.get("mqtt_pass")
@@ -53,7 +57,7 @@ class MqttClient:
         # explicitly to reduce broker overhead — see V-6.
         if isinstance(payload, dict):
             payload = json.dumps(payload)
-        self.client.publish(topic, payload, qos=qos, retain=retain)
+        self._last_publish = self.client.publish(topic, payload, qos=qos, retain=retain)
 
     def subscribe(self, topic_filter, callback):
         self._subscriptions[topic_filter] = callback
@@ -98,8 +102,16 @@ class MqttClient:
             log.warning("MQTT unexpected disconnect (rc=%s), auto-reconnecting", reason_code)
 
     async def disconnect(self):
-        # Allow pending publishes to drain
-        await asyncio.sleep(0.5)
+        # Wait for the last publish (normally the offline status) to be sent
+        # rather than sleeping a fixed interval; paho sends in order.
         loop = asyncio.get_running_loop()
+        info = self._last_publish
+        if info is not None:
+            try:
+                await loop.run_in_executor(
+                    None, info.wait_for_publish, PUBLISH_DRAIN_TIMEOUT
+                )
+            except (RuntimeError, ValueError) as exc:
+                log.debug("Last publish not sent before disconnect: %s", exc)
         await loop.run_in_executor(None, self.client.loop_stop)
         self.client.disconnect()
@@ -0,0 +1,40 @@
+"""Test harness for the vehicle bridge.
+
+python-can is not installed in the dev/test environment, so we inject a
+lightweight fake into sys.modules before the bridge modules are imported. Tests
+supply their own bus objects; the fake only provides the names the bridge uses.
+"""
+import sys
+import types
+from pathlib import Path
+
+# Make the bridge modules importable (they are run as top-level scripts).
+_PKG_DIR = Path(__file__).resolve().parents[1]
+if str(_PKG_DIR) not in sys.path:
+    sys.path.insert(0, str(_PKG_DIR))
+
+
+# --- fake python-can ---
+can = types.ModuleType("can")
+
+
+class CanError(Exception):
+    pass
+
+
+class Message:
+    def __init__(self, arbitration_id=0, data=b"", is_extended_id=True, timestamp=0.0):
+        self.arbitration_id = arbitration_id
+        self.data = bytes(data)
+        self.is_extended_id = is_extended_id
+        self.timestamp = timestamp
+
+
+def _bus(*args, **kwargs):  # pragma: no cover - tests provide their own bus
+    raise CanError("no real CAN bus in tests")
+
+
+can.CanError = CanError
+can.Message = Message
+can.Bus = _bus
+sys.modules["can"] = can
@@ -0,0 +1,132 @@
+import asyncio
+
+import conftest  # registers the python-can fake
+
+from can_bridge import CanBridge, RECV_BATCH_MAX, SEND_BATCH_MAX
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+class FakeMqtt:
+    def publish(self, topic, payload, qos=1, retain=False):
+        pass
+
+    def subscribe(self, topic, callback):
+        pass
+
+
+class FakeBus:
+    """Replays scripted recv results; an exception instance is raised."""
+
+    def __init__(self, results=(), on_send=None):
+        self.results = list(results)
+        self.recv_timeouts = []
+        self.sent = []
+        self.on_send = on_send
+
+    def recv(self, timeout=None):
+        self.recv_timeouts.append(timeout)
+        result = self.results.pop(0) if self.results else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def send(self, msg):
+        self.sent.append(msg)
+        if self.on_send:
+            self.on_send()
+
+
+def make_bridge(bus):
+    bridge = CanBridge({}, FakeMqtt())
+    bridge._bus = bus
+    return bridge
+
+
+def frame(n):
+    return conftest.Message(arbitration_id=n, data=bytes([n % 256]))
+
+
+# --- receive batching ---
+
+def test_recv_batch_is_empty_when_blocking_recv_times_out():
+    bus = FakeBus([None])
+    assert make_bridge(bus)._recv_batch() == []
+    assert bus.recv_timeouts == [1.0]
+
+
+def test_recv_batch_drains_queued_frames_without_blocking():
+    frames = [frame(1), frame(2), frame(3)]
+    bus = FakeBus(frames + [None])
+
+    assert make_bridge(bus)._recv_batch() == frames
+    assert bus.recv_timeouts == [1.0, 0, 0, 0]
+
+
+def test_recv_batch_stops_at_max():
+    frames = [frame(n) for n in range(RECV_BATCH_MAX + 5)]
+    bus = FakeBus(frames)
+
+    assert make_bridge(bus)._recv_batch() == frames[:RECV_BATCH_MAX]
+    assert bus.results == frames[RECV_BATCH_MAX:]
+
+
+def test_recv_batch_keeps_frames_read_before_a_drain_error():
+    frames = [frame(1), frame(2)]
+    later = frame(3)
+    bus = FakeBus(frames + [conftest.CanError("bus-off"), later])
+
+    assert make_bridge(bus)._recv_batch() == frames
+    assert bus.results == [later]
+
+
+# --- send batching ---
+
+def run_one_write_iteration(bridge, payloads):
+    """Queue payloads, then run the write loop until its first batch is sent."""
+    def stop():
+        bridge._stopping = True
+
+    bridge._bus.on_send = stop
+
+    async def scenario():
+        bridge._send_queue = asyncio.Queue()
+        for payload in payloads:
+            bridge._send_queue.put_nowait(payload)
+        await asyncio.wait_for(bridge._write_loop(), timeout=2)
+        return bridge._send_queue.qsize()
+
+    return run(scenario())
+
+
+def test_write_loop_sends_batch_in_order_skipping_none_and_bad_payloads():
+    bus = FakeBus()
+    bridge = make_bridge(bus)
+
+    remaining = run_one_write_iteration(bridge, [
+        "19FEDB94#06FF",
+        None,
+        "not a frame",
+        "1FF#0203",
+        "19FEDB9401",
+    ])
+
+    assert remaining == 0
+    assert [(m.arbitration_id, m.data, m.is_extended_id) for m in bus.sent] == [
+        (0x19FEDB94, b"\x06\xff", True),
+        (0x1FF, b"\x02\x03", False),
+        (0x19FEDB94, b"\x01", True),
+    ]
+
+
+def test_write_loop_batch_stops_at_max():
+    bus = FakeBus()
+    bridge = make_bridge(bus)
+    payloads = [f"{n:08X}#01" for n in range(SEND_BATCH_MAX + 3)]
+
+    remaining = run_one_write_iteration(bridge, payloads)
+
+    assert remaining == 3
+    assert [m.arbitration_id for m in bus.sent] == list(range(SEND_BATCH_MAX))
@@ -6,6 +6,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from can_routing import (
     TOPIC_RAW,
     TOPIC_TIMESTAMPED,
+    format_frame,
     format_timestamped_frame,
     timestamped_topic_for_can_id,
     topic_for_can_id,
@@ -51,3 +52,17 @@ def test_standard_identifier_is_published_and_uses_three_hex_digits():
     assert format_timestamped_frame(Message(), "can0") == (
         "(1704067200.500000) can0 123#0102"
     )
+
+
+def test_timestamped_frame_reuses_preformatted_record():
+    class Message:
+        arbitration_id = 0x19FEDB21
+        is_extended_id = True
+        timestamp = 1704067200.125
+        data = bytes.fromhex("01ff")
+
+    frame = format_frame(Message())
+    assert frame == "19FEDB21#01FF"
+    assert format_timestamped_frame(Message(), "can0", frame) == (
+        "(1704067200.125000) can0 19FEDB21#01FF"
+    )
@@ -7,6 +7,7 @@ _PKG_DIR = Path(__file__).resolve().parents[1]
 if str(_PKG_DIR) not in sys.path:
     sys.path.insert(0, str(_PKG_DIR))
 
+import geo_bridge
 from geo_bridge import GeoBridge
 
 
@@ -33,7 +34,7 @@ def make_bridge(monkeypatch):
         },
         FakeMqtt(),
     )
-    monkeypatch.setattr(bridge, "_load_cities", lambda: [])
+    monkeypatch.setattr(bridge, "_load_cities", lambda: ([], []))
     return bridge
 
 
@@ -81,3 +82,24 @@ def test_start_attempts_one_forced_update_when_coordinates_exist(monkeypatch):
     run(scenario())
 
     assert updates == [(42.0, -76.0, 300.0, "device_tracker.test", True)]
+
+
+def test_nearest_city_matches_full_scan():
+    bridge = GeoBridge({"geo_device_tracker_primary": "device_tracker.test"}, FakeMqtt())
+    bridge._cities, bridge._city_lats = bridge._load_cities()
+    assert bridge._cities
+
+    points = [
+        (42.0, -76.0),      # upstate New York
+        (61.2, -149.9),     # Anchorage
+        (21.3, -157.8),     # Honolulu
+        (25.0, -80.5),      # south of the mainland
+        (49.5, -95.0),      # north of the border
+        (36.0, -40.0),      # mid-Atlantic, far from any city
+    ]
+    for lat, lon in points:
+        expected = min(
+            bridge._cities,
+            key=lambda city: geo_bridge._haversine(lat, lon, city["lat"], city["lon"]),
+        )
+        assert bridge._find_nearest_city(lat, lon) is expected